@@ -5,7 +5,7 @@ from pymongo import GEOSPHERE, MongoClient
 from tqdm import tqdm
 
 from osmthedistance.util import (
-    distance_along, to_geojson, process_in_chunks, remdups
+    distance_along, encode_polyline, lat_lon, to_geojson, process_in_chunks, remdups
 )
 
 
@@ -75,23 +75,30 @@ class Mongo:
         # Iterate over all predicate-ways to obtain inter-vertex distances (edge weights) along each way
         edges = []
         way_ids = self.db[f"way_{predicate.__name__}"].distinct("_id")
-        print("Finding edges and computing their weights by Haversine formula...")
+        print("Finding edges, computing their weights by Haversine formula, and encoding their geometry...")
         for way in tqdm(self.db.way.find({"id": {"$in": way_ids}}, ["nd.ref"]), total=len(way_ids)):
             node_ids = [o["ref"] for o in way["nd"]]
             nodes_unsorted = to_geojson(self.db.node.find({"id": {"$in": node_ids}}, ["id", "lat", "lon"]))
             _nodes_by_id = {n["_id"]: n for n in nodes_unsorted}
             nodes = [_nodes_by_id[nid] for nid in node_ids]
-            last_node_id = None
-            for nid in node_ids:
+            last_idx = None
+            for idx, nid in enumerate(node_ids):
                 if nid in vertex_ids:
-                    if last_node_id is not None:
-                        edges.append((last_node_id, nid, distance_along(last_node_id, nid, nodes)))
-                        last_node_id = nid
-                    else:
-                        last_node_id = nid
+                    if last_idx is not None:
+                        segment = nodes[last_idx:idx + 1]
+                        edges.append((
+                            node_ids[last_idx], nid,
+                            distance_along(node_ids[last_idx], nid, segment),
+                            encode_polyline([lat_lon(n) for n in segment]),
+                        ))
+                    last_idx = idx
         edge_coll = self.db[f"edge_{predicate.__name__}"]
         edge_coll.drop()
-        edge_coll.insert_many([{"v": [start_nid, end_nid], "d": distance} for start_nid, end_nid, distance in edges])
+        # "g" is the edge's shape from v[0] to v[1], including both vertices, as an encoded polyline.
+        edge_coll.insert_many([
+            {"v": [start_nid, end_nid], "d": distance, "g": geometry}
+            for start_nid, end_nid, distance, geometry in edges
+        ])
         print(f"Saved edges to db collection {edge_coll.name}")
         edge_coll.create_index("v")
         print(f"Creating index to efficiently query edges by vertices...")
@@ -2,10 +2,10 @@ import matplotlib.pyplot as plt
 
 
 def plot_route(rg, route):
-    points = [rg.lat_lon(n) for n in route.nodes]
-    lats, lngs = zip(*points)
+    lats, lngs = zip(*rg.route_points(route))
     fig, ax = plt.subplots()
     ax.plot(lngs, lats)
-    for i, (lng, lat) in enumerate(zip(lngs, lats)):
+    for i, n in enumerate(route.nodes):
+        lat, lng = rg.lat_lon(n)
         ax.annotate(i, (lng, lat))
     return fig
@@ -0,0 +1,105 @@
+import json
+
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.collections import LineCollection
+
+from osmthedistance.util import pairwise
+
+
+def iter_route_coordinates(rg, routes):
+    """
+    Yield (route, coords) pairs, where coords is an (n, 2) array of (lon, lat) points tracing the route's geometry.
+
+    Each edge's geometry is decoded at most once per call and shared by every route that traverses it, so rendering
+    or exporting many overlapping candidate routes does not repeat per-vertex lookups. `routes` may be any iterable,
+    including a generator; memory is bounded by the number of distinct edges traversed, not the number of routes.
+    """
+    edge_coords = {}
+
+    def _edge_coords(n1, n2):
+        key = (n1, n2)
+        if key not in edge_coords:
+            # Drop the first point: it is the last point of the preceding edge.
+            edge_coords[key] = np.asarray(rg.edge_points(n1, n2), dtype=float)[1:, ::-1]
+        return edge_coords[key]
+
+    for route in routes:
+        start = np.asarray([rg.lat_lon(route.nodes[0])], dtype=float)[:, ::-1]
+        coords = np.concatenate([start] + [_edge_coords(n1, n2) for n1, n2 in pairwise(route.nodes)])
+        yield route, coords
+
+
+def plot_routes(rg, routes, ax=None, **kwargs):
+    """Draw many routes as a single LineCollection. Extra keyword arguments are passed to LineCollection."""
+    if ax is None:
+        _, ax = plt.subplots()
+    kwargs.setdefault("alpha", 0.3)
+    lines = LineCollection([coords for _, coords in iter_route_coordinates(rg, routes)], **kwargs)
+    ax.add_collection(lines)
+    ax.autoscale_view()
+    return ax.figure
+
+
+def plot_route_density(rg, routes, bins=512, ax=None, cmap="hot", **kwargs):
+    """
+    Rasterize routes into a bins-by-bins grid of traversal counts and show it as a heatmap.
+
+    Each route is resampled at even arc-length steps of at most one grid cell, endpoints included, so a route's
+    contribution follows the distance it travels rather than how densely the underlying way was mapped. If there are
+    no routes, the axes are left empty. Extra keyword arguments are passed to `imshow`.
+    """
+    if ax is None:
+        _, ax = plt.subplots()
+    paths = [coords for _, coords in iter_route_coordinates(rg, routes)]
+    if not paths:
+        return ax.figure
+
+    points = np.concatenate(paths)
+    lower, upper = points.min(axis=0), points.max(axis=0)
+    cell = np.maximum(upper - lower, np.finfo(float).eps) / bins
+
+    samples = []
+    for coords in paths:
+        # Arc length in units of grid cells, then ceil(length) + 1 evenly spaced samples along it.
+        scaled = (coords - lower) / cell
+        arc = np.concatenate([[0.0], np.cumsum(np.hypot(*np.diff(scaled, axis=0).T))])
+        s = np.linspace(0.0, arc[-1], int(np.ceil(arc[-1])) + 1)
+        samples.append(np.column_stack([np.interp(s, arc, scaled[:, 0]), np.interp(s, arc, scaled[:, 1])]))
+    samples = np.concatenate(samples)
+
+    counts, _, _ = np.histogram2d(samples[:, 0], samples[:, 1], bins=bins, range=[[0, bins], [0, bins]])
+    upper = lower + bins * cell
+    ax.imshow(counts.T, origin="lower", extent=(lower[0], upper[0], lower[1], upper[1]), cmap=cmap, aspect="auto",
+              **kwargs)
+    return ax.figure
+
+
+def _format_points(coords, fmt, sep=","):
+    return sep.join(fmt.format(lon, lat) for lon, lat in coords)
+
+
+def write_geojson(rg, routes, fp):
+    """Stream routes to file object fp as a GeoJSON FeatureCollection of LineStrings, one Feature per route."""
+    fp.write('{"type": "FeatureCollection", "features": [')
+    for i, (route, coords) in enumerate(iter_route_coordinates(rg, routes)):
+        if i:
+            fp.write(",")
+        properties = {"distance": route.distance, "overlap": route.overlap, "n_turns": route.n_turns}
+        fp.write('\n{"type": "Feature", "properties": ')
+        fp.write(json.dumps(properties))
+        fp.write(', "geometry": {"type": "LineString", "coordinates": [')
+        fp.write(_format_points(coords, "[{:.6f},{:.6f}]"))
+        fp.write("]}}")
+    fp.write("\n]}\n")
+
+
+def write_gpx(rg, routes, fp):
+    """Stream routes to file object fp as a GPX document, one track per route."""
+    fp.write('<?xml version="1.0" encoding="UTF-8"?>\n'
+             '<gpx version="1.1" creator="osmthedistance" xmlns="http://www.topografix.com/GPX/1/1">\n')
+    for i, (route, coords) in enumerate(iter_route_coordinates(rg, routes)):
+        fp.write(f"<trk><name>Route {i} ({route.distance / 1609.34:.2f} mi)</name><trkseg>")
+        fp.write(_format_points(coords, '<trkpt lat="{1:.6f}" lon="{0:.6f}"/>', sep=""))
+        fp.write("</trkseg></trk>\n")
+    fp.write("</gpx>\n")
@@ -4,7 +4,7 @@ from typing import List
 from haversine import haversine, Unit
 import networkx as nx
 
-from osmthedistance.util import triplewise, surface_turn_angle, pairwise
+from osmthedistance.util import triplewise, surface_turn_angle, pairwise, decode_polyline
 
 
 class Route:
@@ -45,7 +45,8 @@ class RouteGraph:
             for d in vertex_docs
         ])
         self.G.add_edges_from([
-            (d["v"][0], d["v"][1], {"weight": d["d"], "d": d["d"]})
+            # Edge geometry "g" stays encoded, oriented from "v0", until a route is drawn or exported.
+            (d["v"][0], d["v"][1], {"weight": d["d"], "d": d["d"], "g": d.get("g"), "v0": d["v"][0]})
             for d in edge_docs
         ])
 
@@ -74,6 +75,28 @@ class RouteGraph:
     def lat_lon(self, me):
         return self.G.nodes[me]['coords']
 
+    def edge_distance(self, n1, n2):
+        """Distance along the way between adjacent vertices, in meters."""
+        return self.G.edges[n1, n2]['d']
+
+    def edge_points(self, n1, n2):
+        """(lat, lon) points tracing the edge from vertex n1 to vertex n2, including both vertices.
+
+        Falls back to the straight segment between vertices for edge docs stored without geometry.
+        """
+        edge = self.G.edges[n1, n2]
+        if edge.get('g') is None:
+            return [self.lat_lon(n1), self.lat_lon(n2)]
+        points = decode_polyline(edge['g'])
+        return points if edge['v0'] == n1 else points[::-1]
+
+    def route_points(self, route):
+        """(lat, lon) points tracing the full geometry of a route."""
+        points = [self.lat_lon(route.nodes[0])]
+        for n1, n2 in pairwise(route.nodes):
+            points.extend(self.edge_points(n1, n2)[1:])
+        return points
+
     def routes(self):
         """
         Get routes that follow waypoints and that meet the goal distance within tolerance and max_turns.
@@ -122,7 +145,6 @@ class RouteGraph:
     def extend_by_one(self, route) -> List[Route]:
         routes = []
         last_node = route.nodes[-1]
-        last_lat_lon = self.lat_lon(last_node)
         for n in self.neighbors(last_node):
             # The below condition could happen for a loop way with no intersections, such as a short loop in a park.
             # However, it would be difficult to show the resulting route on a map. Thus, I don't consider such a route
@@ -133,7 +155,7 @@ class RouteGraph:
 
             nodes = route.nodes + [n]
             # update distance
-            distance_added = haversine(last_lat_lon, self.lat_lon(n), unit=Unit.METERS)
+            distance_added = self.edge_distance(last_node, n)
             distance = route.distance + distance_added
             # update overlap
             overlap = route.overlap
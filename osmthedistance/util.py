@@ -42,6 +42,50 @@ def distance_along(from_node, to_node, nodes):
     return distance
 
 
+def encode_polyline(points, precision=5):
+    """Encode a sequence of (lat, lon) points as a string, per Google's Encoded Polyline Algorithm Format.
+
+    Coordinates are rounded to `precision` decimal places and delta-encoded as variable-length integers, so a
+    way's shape costs a few bytes per node rather than a pair of floats.
+    """
+    factor = 10 ** precision
+    chunks = []
+    prev_lat, prev_lon = 0, 0
+    for lat, lon in points:
+        lat, lon = int(round(lat * factor)), int(round(lon * factor))
+        for delta in (lat - prev_lat, lon - prev_lon):
+            value = ~(delta << 1) if delta < 0 else (delta << 1)
+            while value >= 0x20:
+                chunks.append(chr((0x20 | (value & 0x1f)) + 63))
+                value >>= 5
+            chunks.append(chr(value + 63))
+        prev_lat, prev_lon = lat, lon
+    return "".join(chunks)
+
+
+def decode_polyline(encoded, precision=5):
+    """Decode a string produced by `encode_polyline` into a list of (lat, lon) points."""
+    factor = 10 ** precision
+    points = []
+    index, lat, lon = 0, 0, 0
+    while index < len(encoded):
+        deltas = []
+        for _ in range(2):
+            shift, value = 0, 0
+            while True:
+                b = ord(encoded[index]) - 63
+                index += 1
+                value |= (b & 0x1f) << shift
+                shift += 5
+                if b < 0x20:
+                    break
+            deltas.append(~(value >> 1) if value & 1 else (value >> 1))
+        lat += deltas[0]
+        lon += deltas[1]
+        points.append((lat / factor, lon / factor))
+    return points
+
+
 def to_geojson(docs):
     """Returns node collection documents in GeoJSON format."""
     return [{
@@ -24,6 +24,7 @@ setup(
         "lxml",
         "matplotlib",
         "networkx",
+        "numpy",
         "pydash",
         "pymongo",
         "requests",